@@ -3,6 +3,7 @@ import logging
 import traceback
 from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -232,6 +233,7 @@ def register_custom_type(tp: Type[TypeEngine], output: Optional[Type] = None) ->
         _field_type_mapping[tp] = output
     else:
         _known_unknown_field_types.add(tp)
+    _type_class_cache.clear()
 
 
 class _CustomSQLAlchemyDummyType(TypeDecorator):
@@ -252,6 +254,36 @@ def make_sqlalchemy_type(name: str) -> Type[TypeEngine]:
     return sqlalchemy_type
 
 
+@lru_cache(maxsize=1024)
+def _get_tag_association(tag: str) -> TagAssociationClass:
+    # Like the sub type and platform instance aspects, one association per tag
+    # is shared by every column that carries it.
+    return TagAssociationClass(make_tag_urn(tag))
+
+
+# Columns share a handful of SQLAlchemy type classes, so resolve each class
+# against the mapping once. register_custom_type clears this cache.
+_type_class_cache: Dict[type, Optional[Type]] = {}
+
+
+def _get_type_class(column_type_class: type) -> Optional[Type]:
+    if column_type_class in _type_class_cache:
+        return _type_class_cache[column_type_class]
+
+    type_class: Optional[Type] = None
+    for sql_type in _field_type_mapping.keys():
+        if issubclass(column_type_class, sql_type):
+            type_class = _field_type_mapping[sql_type]
+            break
+    else:
+        for sql_type in _known_unknown_field_types:
+            if issubclass(column_type_class, sql_type):
+                type_class = NullTypeClass
+                break
+    _type_class_cache[column_type_class] = type_class
+    return type_class
+
+
 def get_column_type(
     sql_report: SQLSourceReport, dataset_name: str, column_type: Any
 ) -> SchemaFieldDataType:
@@ -259,17 +291,7 @@ def get_column_type(
     Maps SQLAlchemy types (https://docs.sqlalchemy.org/en/13/core/type_basics.html) to corresponding schema types
     """
 
-    TypeClass: Optional[Type] = None
-    for sql_type in _field_type_mapping.keys():
-        if isinstance(column_type, sql_type):
-            TypeClass = _field_type_mapping[sql_type]
-            break
-    if TypeClass is None:
-        for sql_type in _known_unknown_field_types:
-            if isinstance(column_type, sql_type):
-                TypeClass = NullTypeClass
-                break
-
+    TypeClass = _get_type_class(type(column_type))
     if TypeClass is None:
         sql_report.report_warning(
             dataset_name, f"unable to map type {column_type!r} to metadata schema"
@@ -346,6 +368,20 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
                 cached_domains=[k for k in self.config.domain], graph=self.ctx.graph
             )
 
+        # Records per schema whether the dialect needs the schema name quoted when
+        # fetching table comments, so later tables skip the failing query.
+        self._needs_quoted_schema: Dict[str, bool] = {}
+
+        self._dataplatform_instance: Optional[DataPlatformInstanceClass] = None
+
+        # Computed once per run so every schema uses the same profiling cut-off.
+        self._profile_threshold_time: Optional[datetime.datetime] = None
+        updated_since_days = self.config.profiling.profile_if_updated_since_days
+        if updated_since_days is not None:
+            self._profile_threshold_time = datetime.datetime.now(
+                datetime.timezone.utc
+            ) - datetime.timedelta(days=updated_since_days)
+
     def warn(self, log: logging.Logger, key: str, reason: str) -> None:
         self.report.report_warning(key, reason)
         log.warning(f"{key} => {reason}")
@@ -546,20 +582,21 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             inspector=inspector,
         )
 
-        source_fields = [
-            f"urn:li:schemaField:({dataset_urn},{f})"
-            for f in fk_dict["constrained_columns"]
-        ]
         foreign_dataset = make_dataset_urn_with_platform_instance(
             platform=self.platform,
             name=referred_dataset_name,
             platform_instance=self.config.platform_instance,
             env=self.config.env,
         )
-        foreign_fields = [
-            f"urn:li:schemaField:({foreign_dataset},{f})"
-            for f in fk_dict["referred_columns"]
+
+        # The schema field urn prefix only depends on the dataset, so build it
+        # once per constraint instead of formatting it for every column.
+        source_prefix = "urn:li:schemaField:(" + dataset_urn + ","
+        source_fields = [
+            source_prefix + f + ")" for f in fk_dict["constrained_columns"]
         ]
+        foreign_prefix = "urn:li:schemaField:(" + foreign_dataset + ","
+        foreign_fields = [foreign_prefix + f + ")" for f in fk_dict["referred_columns"]]
 
         return ForeignKeyConstraint(
             fk_dict["name"], foreign_fields, source_fields, foreign_dataset
@@ -705,6 +742,14 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
     ) -> Optional[Dict[str, str]]:
         return None
 
+    @staticmethod
+    def _extract_description(table_info: dict) -> Optional[str]:
+        description = table_info.get("text")
+        if isinstance(description, tuple):
+            # Handling for value type tuple which is coming for dialect 'db2+ibm_db'
+            description = description[0]
+        return description
+
     def get_table_properties(
         self, inspector: Inspector, schema: str, table: str
     ) -> Tuple[Optional[str], Dict[str, str], Optional[str]]:
@@ -718,21 +763,29 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         try:
             # SQLAlchemy stubs are incomplete and missing this method.
             # PR: https://github.com/dropbox/sqlalchemy-stubs/pull/223.
-            table_info: dict = inspector.get_table_comment(table, schema)  # type: ignore
+            if self._needs_quoted_schema.get(schema):
+                table_info: dict = inspector.get_table_comment(table, f'"{schema}"')  # type: ignore
+            else:
+                table_info = inspector.get_table_comment(table, schema)  # type: ignore
+                self._needs_quoted_schema.setdefault(schema, False)
         except NotImplementedError:
             return description, properties, location
         except ProgrammingError as pe:
-            # Snowflake needs schema names quoted when fetching table comments.
-            logger.debug(
-                f"Encountered ProgrammingError. Retrying with quoted schema name for schema {schema} and table {table}",
-                pe,
-            )
-            table_info: dict = inspector.get_table_comment(table, f'"{schema}"')  # type: ignore
+            if self._needs_quoted_schema.get(schema):
+                # Quoting worked for other tables of the schema but not this one.
+                table_info = inspector.get_table_comment(table, schema)  # type: ignore
+            else:
+                # Snowflake needs schema names quoted when fetching table comments.
+                logger.debug(
+                    "Encountered ProgrammingError. Retrying with quoted schema name for schema %s and table %s",
+                    schema,
+                    table,
+                    exc_info=pe,
+                )
+                table_info = inspector.get_table_comment(table, f'"{schema}"')  # type: ignore
+                self._needs_quoted_schema.setdefault(schema, True)
 
-        description = table_info.get("text")
-        if type(description) is tuple:
-            # Handling for value type tuple which is coming for dialect 'db2+ibm_db'
-            description = table_info["text"][0]
+        description = self._extract_description(table_info)
 
         # The "properties" field is a non-standard addition to SQLAlchemy's interface.
         properties = table_info.get("properties", {})
@@ -743,14 +796,17 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
     ) -> Optional[MetadataWorkUnit]:
         # If we are a platform instance based source, emit the instance aspect
         if self.config.platform_instance:
-            return MetadataChangeProposalWrapper(
-                entityUrn=dataset_urn,
-                aspect=DataPlatformInstanceClass(
+            # The aspect is the same for every dataset of the run, build it only once.
+            if self._dataplatform_instance is None:
+                self._dataplatform_instance = DataPlatformInstanceClass(
                     platform=make_data_platform_urn(self.platform),
                     instance=make_dataplatform_instance_urn(
                         self.platform, self.config.platform_instance
                     ),
-                ),
+                )
+            return MetadataChangeProposalWrapper(
+                entityUrn=dataset_urn,
+                aspect=self._dataplatform_instance,
             ).as_workunit()
         else:
             return None
@@ -813,13 +869,13 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
     ) -> List[SchemaField]:
         gtc: Optional[GlobalTagsClass] = None
         if tags:
-            tags_str = [make_tag_urn(t) for t in tags]
-            tags_tac = [TagAssociationClass(t) for t in tags_str]
-            gtc = GlobalTagsClass(tags_tac)
+            gtc = GlobalTagsClass([_get_tag_association(t) for t in tags])
         field = SchemaField(
             fieldPath=column["name"],
             type=get_column_type(self.report, dataset_name, column["type"]),
-            nativeDataType=column.get("full_type", repr(column["type"])),
+            nativeDataType=column["full_type"]
+            if "full_type" in column
+            else repr(column["type"]),
             description=column.get("comment", None),
             nullable=column["nullable"],
             recursive=False,
@@ -1000,12 +1056,11 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         inspector: Inspector,
         profile_candidates: Optional[List[str]],
     ) -> bool:
+        # check the candidate list before running the pattern regexes
         return (
-            sql_config.table_pattern.allowed(dataset_name)
+            (profile_candidates is None or dataset_name in profile_candidates)
+            and sql_config.table_pattern.allowed(dataset_name)
             and sql_config.profile_pattern.allowed(dataset_name)
-        ) and (
-            profile_candidates is None
-            or (profile_candidates is not None and dataset_name in profile_candidates)
         )
 
     def loop_profiler_requests(
@@ -1024,15 +1079,8 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             or sql_config.profiling.profile_table_row_limit is None
         ):
             try:
-                threshold_time: Optional[datetime.datetime] = None
-                if sql_config.profiling.profile_if_updated_since_days is not None:
-                    threshold_time = datetime.datetime.now(
-                        datetime.timezone.utc
-                    ) - datetime.timedelta(
-                        sql_config.profiling.profile_if_updated_since_days
-                    )
                 profile_candidates = self.generate_profile_candidates(
-                    inspector, threshold_time, schema
+                    inspector, self._profile_threshold_time, schema
                 )
             except NotImplementedError:
                 logger.debug("Source does not support generating profile candidates.")
@@ -1041,6 +1089,11 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             dataset_name = self.get_identifier(
                 schema=schema, entity=table, inspector=inspector
             )
+            if dataset_name in tables_seen:
+                logger.debug(f"{dataset_name} has already been seen, skipping...")
+                continue
+            tables_seen.add(dataset_name)
+
             if not self.is_dataset_eligible_for_profiling(
                 dataset_name, sql_config, inspector, profile_candidates
             ):
@@ -1048,12 +1101,6 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
                     self.report.report_dropped(f"profile of {dataset_name}")
                 continue
 
-            if dataset_name not in tables_seen:
-                tables_seen.add(dataset_name)
-            else:
-                logger.debug(f"{dataset_name} has already been seen, skipping...")
-                continue
-
             missing_column_info_warn = self.report.warnings.get(MISSING_COLUMN_INFO)
             if (
                 missing_column_info_warn is not None
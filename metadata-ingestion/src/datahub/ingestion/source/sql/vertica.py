@@ -1,17 +1,29 @@
 import logging
-import traceback
+import re
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from functools import lru_cache
+from itertools import groupby
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import pydantic
 from pydantic.class_validators import validator
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.reflection import Inspector
 from vertica_sqlalchemy_dialect.base import VerticaInspector
 
 from datahub.configuration.common import AllowDenyPattern
-from datahub.emitter.mce_builder import (
-    dataset_urn_to_key,
-    make_dataset_urn_with_platform_instance,
-)
+from datahub.emitter.mce_builder import make_dataset_urn_with_platform_instance
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.mcp_builder import add_owner_to_entity_wu
 from datahub.ingestion.api.common import PipelineContext
@@ -42,10 +54,8 @@ from datahub.metadata.com.linkedin.pegasus2avro.dataset import UpstreamLineage
 from datahub.metadata.com.linkedin.pegasus2avro.metadata.snapshot import DatasetSnapshot
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
 from datahub.metadata.schema_classes import (
-    ChangeTypeClass,
     DatasetLineageTypeClass,
     DatasetPropertiesClass,
-    ForeignKeyConstraintClass,
     SubTypesClass,
     UpstreamClass,
     _Aspect,
@@ -57,6 +67,70 @@ if TYPE_CHECKING:
 MISSING_COLUMN_INFO = "missing column information"
 logger: logging.Logger = logging.getLogger(__name__)
 
+_PREFIX_UNSAFE_REGEX = re.compile(r"\$|\\[ZbB]|\(\?[=!]")
+
+_VIEW_DEFINITIONS_QUERY = text(
+    "SELECT table_name, view_definition FROM v_catalog.views "
+    "WHERE lower(table_schema) = :schema"
+)
+
+_VIEW_LINEAGE_QUERY = text(
+    "SELECT table_schema, table_name, reference_table_schema, reference_table_name "
+    "FROM v_catalog.view_tables WHERE table_schema = :schema "
+    "ORDER BY table_schema, table_name"
+)
+
+_PROJECTION_LINEAGE_QUERY = text(
+    "SELECT schemaname, name, basename FROM vs_projections WHERE schemaname = :schema"
+)
+
+# the sub type aspect only depends on the kind of entity, so build each one once
+_SUBTYPES_ASPECTS: Dict[str, SubTypesClass] = {
+    subtype: SubTypesClass(typeNames=[subtype])
+    for subtype in (
+        DatasetSubTypes.TABLE,
+        DatasetSubTypes.VIEW,
+        "Projections",
+        "ML Models",
+    )
+}
+
+
+@lru_cache(maxsize=4096)
+def _get_upstream_name(schema: str, table: str) -> str:
+    # Upstream tables repeat across views and projections of a schema; caching
+    # the name shares one string per table instead of one per lineage edge.
+    return f"{schema}.{table}"
+
+
+def _group_columns_by_table(columns: List[dict]) -> Dict[str, List[dict]]:
+    columns_by_table: Dict[str, List[dict]] = defaultdict(list)
+    for column in columns:
+        columns_by_table[column["tablename"].lower()].append(column)
+    return columns_by_table
+
+
+def _is_schema_denied(pattern: AllowDenyPattern, schema: str) -> bool:
+    """
+    Returns True if a deny regex of `pattern` rejects every `<schema>.<entity>` name.
+
+    re.match only anchors at the start, so a deny regex that matches the
+    `<schema>.` prefix matches every name in that schema as well. Regexes that
+    look past the prefix (end anchors, lookaheads, word boundaries) are skipped
+    since the prefix alone does not decide them.
+    """
+    prefix = f"{schema}."
+    return any(
+        re.match(deny_pattern, prefix, pattern.regex_flags)
+        for deny_pattern in pattern.deny
+        if not _PREFIX_UNSAFE_REGEX.search(deny_pattern)
+    )
+
+
+def _get_owner_by_table(owners: Iterable[Any]) -> Dict[str, str]:
+    # owner rows are (table_name, owner_name) tuples, the last match wins
+    return {owner[0].lower(): owner[1] for owner in owners}
+
 
 @dataclass
 class VerticaSourceReport(SQLSourceReport):
@@ -128,12 +202,144 @@ class VerticaSource(SQLAlchemySource):
         super(VerticaSource, self).__init__(config, ctx, "vertica")
         self.report: SQLSourceReport = VerticaSourceReport()
         self.config: VerticaConfig = config
+        self._engine: Optional[Engine] = None
+        self._identifiers: Dict[Tuple[str, str], str] = {}
+        # Urns are built for every dataset and again for each lineage edge, keep
+        # them for the lifetime of this source only.
+        self._dataset_urns: Dict[str, str] = {}
+        self._db_name: Optional[str] = None
 
     @classmethod
     def create(cls, config_dict: Dict, ctx: PipelineContext) -> "VerticaSource":
         config = VerticaConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def _get_engine(self) -> Engine:
+        # Create the engine once so every inspector of the run shares its
+        # connection pool.
+        if self._engine is None:
+            url = self.config.get_sql_alchemy_url()
+            logger.debug(f"sql_alchemy_url={url}")
+            self._engine = create_engine(url, **self.config.options)
+        return self._engine
+
+    def get_inspectors(self) -> Iterable[Inspector]:
+        with self._get_engine().connect() as conn:
+            inspector = inspect(conn)
+            yield inspector
+
+    def close(self) -> None:
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+        super().close()
+
+    def get_identifier(
+        self, *, schema: str, entity: str, inspector: VerticaInspector, **kwargs: Any
+    ) -> str:
+        # VerticaConfig has no deprecated get_identifier hook, so the identifier
+        # only depends on the schema and entity names and can be memoized.
+        key = (schema, entity)
+        if key not in self._identifiers:
+            self._identifiers[key] = f"{schema}.{entity}"
+        return self._identifiers[key]
+
+    def get_db_name(self, inspector: VerticaInspector) -> str:
+        # Called for every entity, but get_inspectors yields a single inspector
+        # for the configured database, so the name never changes during a run.
+        if self._db_name is None:
+            self._db_name = super().get_db_name(inspector)
+        return self._db_name
+
+    def _make_dataset_urn(self, dataset_name: str) -> str:
+        if dataset_name not in self._dataset_urns:
+            self._dataset_urns[dataset_name] = make_dataset_urn_with_platform_instance(
+                self.platform,
+                dataset_name,
+                self.config.platform_instance,
+                self.config.env,
+            )
+        return self._dataset_urns[dataset_name]
+
+    def _get_projection_names(
+        self, inspector: VerticaInspector, schema: str
+    ) -> List[str]:
+        # The dialect does not wrap get_projection_names in @reflection.cache, so
+        # keep the result in the inspector's info_cache. get_inspectors yields a
+        # single inspector per run, which lets loop_projections and
+        # loop_profiler_requests share one lookup per schema.
+        key = ("vertica_projection_names", schema)
+        if key not in inspector.info_cache:
+            inspector.info_cache[key] = inspector.get_projection_names(schema)
+        return inspector.info_cache[key]
+
+    def _get_view_definitions(
+        self, inspector: VerticaInspector, schema: str
+    ) -> Dict[str, str]:
+        # get_view_definition issues one query per view and is not reflection
+        # cached, so fetch the definitions of the whole schema in one go.
+        key = ("vertica_view_definitions", schema)
+        if key not in inspector.info_cache:
+            inspector.info_cache[key] = {
+                row["table_name"]: str(row["view_definition"])
+                for row in inspector.bind.execute(
+                    _VIEW_DEFINITIONS_QUERY, schema=schema.lower()
+                )
+                if row["view_definition"] is not None
+            }
+        return inspector.info_cache[key]
+
+    def _get_view_lineage_map(
+        self, inspector: VerticaInspector, schema: str
+    ) -> Dict[str, List[str]]:
+        """
+        Returns the upstream tables of every view in the schema, keyed by
+        `<schema>.<view>`, built from a single v_catalog.view_tables query.
+        """
+        key = ("vertica_view_lineage", schema)
+        if key not in inspector.info_cache:
+            view_lineage_map: Dict[str, List[str]] = defaultdict(list)
+            # rows come ordered by view, so each view's upstreams are added at once
+            for (view_schema, view_name), rows in groupby(
+                inspector.bind.execute(_VIEW_LINEAGE_QUERY, schema=schema),
+                key=lambda row: (row["table_schema"], row["table_name"]),
+            ):
+                view_lineage_map[f"{view_schema}.{view_name}"].extend(
+                    _get_upstream_name(
+                        row["reference_table_schema"], row["reference_table_name"]
+                    )
+                    for row in rows
+                )
+            logger.info(
+                "A total of %d view upstream edges found for %s",
+                sum(map(len, view_lineage_map.values())),
+                schema,
+            )
+            inspector.info_cache[key] = view_lineage_map
+        return inspector.info_cache[key]
+
+    def _get_projection_lineage_map(
+        self, inspector: VerticaInspector, schema: str
+    ) -> Dict[str, List[str]]:
+        """
+        Returns the anchor table of every projection in the schema, keyed by
+        `<schema>.<projection>`, built from a single vs_projections query.
+        """
+        key = ("vertica_projection_lineage", schema)
+        if key not in inspector.info_cache:
+            projection_lineage_map: Dict[str, List[str]] = defaultdict(list)
+            for row in inspector.bind.execute(_PROJECTION_LINEAGE_QUERY, schema=schema):
+                projection_lineage_map[f"{row['schemaname']}.{row['name']}"].append(
+                    _get_upstream_name(row["schemaname"], row["basename"])
+                )
+            logger.info(
+                "A total of %d projection upstream edges found for %s",
+                sum(map(len, projection_lineage_map.values())),
+                schema,
+            )
+            inspector.info_cache[key] = projection_lineage_map
+        return inspector.info_cache[key]
+
     def get_workunits(self) -> Iterable[MetadataWorkUnit]:
         return auto_workunit_reporter(self.report, self.get_workunits_internal())
 
@@ -220,13 +426,89 @@ class VerticaSource(SQLAlchemySource):
             )
         return None
 
+    def _process_entity(
+        self,
+        *,
+        dataset_name: str,
+        dataset_urn: str,
+        inspector: VerticaInspector,
+        schema: str,
+        entity: str,
+        description: Optional[str],
+        properties: Dict[str, str],
+        columns: List[dict],
+        subtype: str,
+        sql_config: SQLAlchemyConfig,
+        pk_constraints: Optional[dict] = None,
+    ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
+        """
+        Emits the workunits shared by tables, views, projections and ml models.
+
+        Args:
+            entity (str): table, view, projection or ml model name
+            subtype (str): dataset sub type of the entity
+            columns (List[dict]): columns of the entity, already filtered from
+                the schema level column list
+
+        Yields:
+            Iterator[Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]]:
+        """
+        dataset_snapshot = DatasetSnapshot(
+            urn=dataset_urn,
+            aspects=[StatusClass(removed=False)],
+        )
+        dataset_properties = DatasetPropertiesClass(
+            name=entity,
+            description=description,
+            customProperties=properties,
+        )
+        dataset_snapshot.aspects.append(dataset_properties)
+
+        schema_fields = self.get_schema_fields(dataset_name, columns, pk_constraints)
+        schema_metadata = get_schema_metadata(
+            self.report,
+            dataset_name,
+            self.platform,
+            columns,
+            pk_constraints,
+            canonical_schema=schema_fields,
+        )
+        dataset_snapshot.aspects.append(schema_metadata)
+
+        db_name = self.get_db_name(inspector)
+        yield from self.add_table_to_schema_container(
+            dataset_urn=dataset_urn, db_name=db_name, schema=schema
+        )
+        mce = MetadataChangeEvent(proposedSnapshot=dataset_snapshot)
+        yield SqlWorkUnit(id=dataset_name, mce=mce)
+
+        dpi_aspect = self.get_dataplatform_instance_aspect(dataset_urn=dataset_urn)
+        if dpi_aspect:
+            yield dpi_aspect
+        yield MetadataChangeProposalWrapper(
+            entityUrn=dataset_urn,
+            aspect=_SUBTYPES_ASPECTS[subtype],
+        ).as_workunit()
+
+        if self.config.domain:
+            assert self.domain_registry
+            yield from get_domain_wu(
+                dataset_name=dataset_name,
+                entity_urn=dataset_urn,
+                domain_config=sql_config.domain,
+                domain_registry=self.domain_registry,
+            )
+
     def loop_tables(  # noqa: C901
         self,
         inspector: VerticaInspector,
         schema: str,
         sql_config: SQLAlchemyConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
-        tables_seen: Set[str] = set()
+        if _is_schema_denied(sql_config.table_pattern, schema):
+            self.report.report_dropped(f"{schema}.*")
+            return
+
         try:
             tables = inspector.get_table_names(schema)
             # created new function get_all_columns in vertica Dialect as the existing get_columns of SQLAlchemy VerticaInspector class is being used for profiling
@@ -242,143 +524,74 @@ class VerticaSource(SQLAlchemySource):
             # called get_table_owner function from vertica dialect , it returns a list of all owners of all table in the current schema
             table_owner = inspector.get_table_owner(schema)
 
-            # loops on each table in the schema
-            for table_name in tables:
-                finalcolumns = []
-                # loops through columns in the schema and creates all columns on current table
-                for column in columns:
-                    if column["tablename"] == table_name.lower():
-                        finalcolumns.append(column)
-
-                final_primary_key: dict = {}
-                # loops through primary_key in the schema and saves the pk of current table
-                for primary_key_column in primary_key:
-
-                    if (
-                        isinstance(primary_key_column, dict)
-                        and primary_key_column.get("tablename", "").lower()
-                        == table_name.lower()
-                    ):
-                        final_primary_key = primary_key_column
-
-                table_properties: Dict[str, str] = {}
-                # loops through properties  in the schema and saves the properties of current table
-                for data in properties:
-                    if (
-                        isinstance(data, dict)
-                        and "table_name" in data
-                        and data["table_name"] == table_name.lower()
-                    ):
-                        if "create_time" in data:
-                            table_properties["create_time"] = data["create_time"]
-                        if "table_size" in data:
-                            table_properties["table_size"] = data["table_size"]
-
-                owner_name = None
-                # loops through all owners in the schema and saved the value of current table owner
-                for owner in table_owner:
-                    if owner[0].lower() == table_name.lower():
-                        owner_name = owner[1]
+            # the dialect returns schema level lists, index them by table name once
+            # instead of scanning every list for each table in the schema
+            columns_by_table = _group_columns_by_table(columns)
+            owner_by_table = _get_owner_by_table(table_owner)
+            primary_key_by_table: Dict[str, dict] = {
+                primary_key_column.get("tablename", "").lower(): primary_key_column
+                for primary_key_column in primary_key
+                if isinstance(primary_key_column, dict)
+            }
+            properties_by_table: Dict[str, Dict[str, str]] = defaultdict(dict)
+            for data in properties:
+                if isinstance(data, dict) and "table_name" in data:
+                    for key in ("create_time", "table_size"):
+                        if key in data:
+                            properties_by_table[data["table_name"]][key] = data[key]
 
+            # loops on each table in the schema
+            for table_name in dict.fromkeys(tables):
                 dataset_name = self.get_identifier(
                     schema=schema, entity=table_name, inspector=inspector
                 )
 
-                if dataset_name not in tables_seen:
-                    tables_seen.add(dataset_name)
-                else:
-                    logger.debug(f"{dataset_name} has already been seen, skipping...")
-                    continue
                 self.report.report_entity_scanned(dataset_name, ent_type="table")
                 if not sql_config.table_pattern.allowed(dataset_name):
                     self.report.report_dropped(dataset_name)
                     continue
-                dataset_urn = make_dataset_urn_with_platform_instance(
-                    self.platform,
-                    dataset_name,
-                    self.config.platform_instance,
-                    self.config.env,
+
+                lower_table_name = table_name.lower()
+                finalcolumns = columns_by_table.get(lower_table_name, [])
+                final_primary_key: Optional[dict] = primary_key_by_table.get(
+                    lower_table_name
                 )
+                table_properties: Dict[str, str] = {}
+                if lower_table_name in properties_by_table:
+                    table_properties.update(properties_by_table[lower_table_name])
+                owner_name = owner_by_table.get(lower_table_name)
+
+                dataset_urn = self._make_dataset_urn(dataset_name)
 
                 yield from add_owner_to_entity_wu(
                     entity_type="dataset",
                     entity_urn=dataset_urn,
                     owner_urn=f"urn:li:corpuser:{owner_name}",
                 )
-                dataset_snapshot = DatasetSnapshot(
-                    urn=dataset_urn,
-                    aspects=[StatusClass(removed=False)],
-                )
-
-                dataset_properties = DatasetPropertiesClass(
-                    name=table_name,
+                yield from self._process_entity(
+                    dataset_name=dataset_name,
+                    dataset_urn=dataset_urn,
+                    inspector=inspector,
+                    schema=schema,
+                    entity=table_name,
                     description=description,
-                    customProperties=table_properties,
+                    properties=table_properties,
+                    columns=finalcolumns,
+                    subtype=DatasetSubTypes.TABLE,
+                    sql_config=sql_config,
+                    pk_constraints=final_primary_key,
                 )
 
-                dataset_snapshot.aspects.append(dataset_properties)
-
-                pk_constraints: dict = final_primary_key
-                extra_tags: Optional[Dict[str, List[str]]] = None
-                foreign_keys: list = []
-
-                schema_fields = self.get_schema_fields(
-                    dataset_name, finalcolumns, pk_constraints, tags=extra_tags
-                )
-
-                schema_metadata = get_schema_metadata(
-                    self.report,
-                    dataset_name,
-                    self.platform,
-                    finalcolumns,
-                    pk_constraints,
-                    foreign_keys,
-                    schema_fields,
-                )
-                dataset_snapshot.aspects.append(schema_metadata)
-
-                db_name = self.get_db_name(inspector)
-                yield from self.add_table_to_schema_container(
-                    dataset_urn=dataset_urn, db_name=db_name, schema=schema
-                )
-                mce = MetadataChangeEvent(proposedSnapshot=dataset_snapshot)
-
-                wu = SqlWorkUnit(id=dataset_name, mce=mce)
-                self.report.report_workunit(wu)
-                yield wu
-
-                dpi_aspect = self.get_dataplatform_instance_aspect(
-                    dataset_urn=dataset_urn
-                )
-                if dpi_aspect:
-                    yield dpi_aspect
-                subtypes_aspect = MetadataWorkUnit(
-                    id=f"{dataset_name}-subtypes",
-                    mcp=MetadataChangeProposalWrapper(
-                        entityUrn=dataset_urn,
-                        aspect=SubTypesClass(typeNames=[DatasetSubTypes.TABLE]),
-                    ),
-                )
-                self.report.report_workunit(subtypes_aspect)
-                yield subtypes_aspect
-                if self.config.domain:
-                    assert self.domain_registry
-
-                    yield from get_domain_wu(
-                        dataset_name=dataset_name,
-                        entity_urn=dataset_urn,
-                        domain_config=sql_config.domain,
-                        domain_registry=self.domain_registry,
-                    )
-
         except Exception as e:
-            print(traceback.format_exc())
+            logger.debug("Unable to ingest tables of schema %s", schema, exc_info=True)
             self.report.report_failure(f"{schema}", f"Tables error: {e}")
 
     def loop_views(  # noqa: C901
         self, inspector: VerticaInspector, schema: str, sql_config: SQLAlchemyConfig
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
-        views_seen: Set[str] = set()
+        if _is_schema_denied(sql_config.table_pattern, schema):
+            self.report.report_dropped(f"{schema}.*")
+            return
 
         try:
             views = inspector.get_view_names(schema)
@@ -395,182 +608,87 @@ class VerticaSource(SQLAlchemySource):
             # called get_view_owner function from dialect , it returns a list of all owner of all view in the schema
             view_owner = inspector.get_view_owner(schema)
 
-            # started a loop on each view in the schema
-            for view_name in views:
-                finalcolumns = []
-                # loops through columns in the schema and creates all columns on current view
-                for column in columns:
-                    if column["tablename"].lower() == view_name.lower():
-                        finalcolumns.append(column)
-
-                view_properties = {}
-                # loops through properties  in the schema and saves the properties of current views
-                for data in properties:
-                    if (
-                        isinstance(data, dict)
-                        and data.get("table_name", "").lower() == view_name.lower()
-                    ):
-                        view_properties["create_time"] = data.get("create_time", "")
-
-                owner_name = None
-                # loops through all views in the schema and returns the owner name of current view
-                for owner in view_owner:
-                    if owner[0].lower() == view_name.lower():
-                        owner_name = owner[1]
-
-                try:
-                    view_definition = inspector.get_view_definition(view_name, schema)
-                    if view_definition is None:
-                        view_definition = ""
-                    else:
-                        # Some dialects return a TextClause instead of a raw string,
-                        # so we need to convert them to a string.
-                        view_definition = str(view_definition)
-
-                except NotImplementedError:
-                    view_definition = ""
-                view_properties["view_definition"] = view_definition
-                view_properties["is_view"] = "True"
+            # the dialect returns schema level lists, index them by view name once
+            # instead of scanning every list for each view in the schema
+            columns_by_view = _group_columns_by_table(columns)
+            owner_by_view = _get_owner_by_table(view_owner)
+            create_time_by_view: Dict[str, str] = {
+                data.get("table_name", "").lower(): data.get("create_time", "")
+                for data in properties
+                if isinstance(data, dict)
+            }
+            view_definitions = self._get_view_definitions(inspector, schema)
 
+            # started a loop on each view in the schema
+            for view_name in dict.fromkeys(views):
                 dataset_name = self.get_identifier(
                     schema=schema, entity=view_name, inspector=inspector
                 )
 
-                if dataset_name not in views_seen:
-                    views_seen.add(dataset_name)
-                else:
-                    logger.debug(f"{dataset_name} has already been seen, skipping...")
-                    continue
-
                 self.report.report_entity_scanned(dataset_name, ent_type="view")
 
                 if not sql_config.table_pattern.allowed(dataset_name):
                     self.report.report_dropped(dataset_name)
                     continue
 
-                dataset_urn = make_dataset_urn_with_platform_instance(
-                    self.platform,
-                    dataset_name,
-                    self.config.platform_instance,
-                    self.config.env,
-                )
+                lower_view_name = view_name.lower()
+                finalcolumns = columns_by_view.get(lower_view_name, [])
+
+                view_properties = {}
+                if lower_view_name in create_time_by_view:
+                    view_properties["create_time"] = create_time_by_view[
+                        lower_view_name
+                    ]
+
+                owner_name = owner_by_view.get(lower_view_name)
+
+                view_definition = view_definitions.get(view_name, "")
+                view_properties["view_definition"] = view_definition
+                view_properties["is_view"] = "True"
+
+                dataset_urn = self._make_dataset_urn(dataset_name)
 
                 yield from add_owner_to_entity_wu(
                     entity_type="dataset",
                     entity_urn=dataset_urn,
                     owner_urn=f"urn:li:corpuser:{owner_name}",
                 )
-
-                dataset_snapshot = DatasetSnapshot(
-                    urn=dataset_urn,
-                    aspects=[StatusClass(removed=False)],
-                )
-
-                dataset_properties = DatasetPropertiesClass(
-                    name=view_name,
+                yield from self._process_entity(
+                    dataset_name=dataset_name,
+                    dataset_urn=dataset_urn,
+                    inspector=inspector,
+                    schema=schema,
+                    entity=view_name,
                     description=description,
-                    customProperties=view_properties,
-                )
-
-                dataset_snapshot.aspects.append(dataset_properties)
-                pk_constraints: dict = {}
-                extra_tags: Optional[Dict[str, List[str]]] = None
-                foreign_keys: Optional[List[ForeignKeyConstraintClass]] = None
-
-                schema_fields = self.get_schema_fields(
-                    dataset_name, finalcolumns, pk_constraints, tags=extra_tags
+                    properties=view_properties,
+                    columns=finalcolumns,
+                    subtype=DatasetSubTypes.VIEW,
+                    sql_config=sql_config,
                 )
 
-                schema_metadata = get_schema_metadata(
-                    self.report,
-                    dataset_name,
-                    self.platform,
-                    finalcolumns,
-                    pk_constraints,
-                    foreign_keys,
-                    schema_fields,
-                )
-                dataset_snapshot.aspects.append(schema_metadata)
-
-                db_name = self.get_db_name(inspector)
-                yield from self.add_table_to_schema_container(
-                    dataset_urn=dataset_urn, db_name=db_name, schema=schema
-                )
-                mce = MetadataChangeEvent(proposedSnapshot=dataset_snapshot)
-
-                wu = SqlWorkUnit(id=dataset_name, mce=mce)
-                self.report.report_workunit(wu)
-                yield wu
-
-                dpi_aspect = self.get_dataplatform_instance_aspect(
-                    dataset_urn=dataset_urn
-                )
-                if dpi_aspect:
-                    yield dpi_aspect
-                subtypes_aspect = MetadataWorkUnit(
-                    id=f"{dataset_name}-subtypes",
-                    mcp=MetadataChangeProposalWrapper(
-                        entityUrn=dataset_urn,
-                        aspect=SubTypesClass(typeNames=[DatasetSubTypes.VIEW]),
-                    ),
-                )
-                self.report.report_workunit(subtypes_aspect)
-                yield subtypes_aspect
-                if self.config.domain:
-                    assert self.domain_registry
-                    yield from get_domain_wu(
-                        dataset_name=dataset_name,
-                        entity_urn=dataset_urn,
-                        domain_config=sql_config.domain,
-                        domain_registry=self.domain_registry,
-                    )
-
                 if self.config.include_view_lineage:
                     try:
-                        dataset_urn = make_dataset_urn_with_platform_instance(
-                            self.platform,
-                            dataset_name,
-                            self.config.platform_instance,
-                            self.config.env,
-                        )
-
-                        dataset_snapshot = DatasetSnapshot(
-                            urn=dataset_urn, aspects=[StatusClass(removed=False)]
-                        )
-
                         lineage_info = self._get_upstream_lineage_info(
-                            dataset_urn, schema, inspector
+                            dataset_name, schema, inspector
                         )
 
                         if lineage_info is not None:
-                            upstream_lineage = lineage_info
-
-                            lineage_mcpw = MetadataChangeProposalWrapper(
-                                entityType="dataset",
-                                changeType=ChangeTypeClass.UPSERT,
-                                entityUrn=dataset_snapshot.urn,
-                                aspectName="upstreamLineage",
-                                aspect=upstream_lineage,
-                            )
-
-                            lineage_wu = MetadataWorkUnit(
-                                id=f"{self.platform}-{lineage_mcpw.entityUrn}-{lineage_mcpw.aspectName}",
-                                mcp=lineage_mcpw,
-                            )
-
-                            self.report.report_workunit(lineage_wu)
-                            yield lineage_wu
+                            yield MetadataChangeProposalWrapper(
+                                entityUrn=dataset_urn, aspect=lineage_info
+                            ).as_workunit()
 
                     except Exception as e:
                         logger.warning(
-                            f"Unable to get lineage of view {view_name} due to an exception.\n {traceback.format_exc()}"
+                            "Unable to get lineage of view %s due to an exception.",
+                            view_name,
+                            exc_info=True,
                         )
                         self.report.report_warning(
                             f"{view_name}", f"Ingestion error: {e}"
                         )
 
         except Exception as e:
-            print(traceback.format_exc())
+            logger.debug("Unable to ingest views of schema %s", schema, exc_info=True)
             self.report.report_failure(f"{schema}", f"Views error: {e}")
 
     def get_view_properties(
@@ -598,48 +716,27 @@ class VerticaSource(SQLAlchemySource):
         return description, properties, location
 
     def _get_upstream_lineage_info(
-        self, dataset_urn: str, schema: str, inspector: VerticaInspector
+        self, dataset_name: str, schema: str, inspector: VerticaInspector
     ) -> Optional[_Aspect]:
-        dataset_key = dataset_urn_to_key(dataset_urn)
-        if dataset_key is None:
-            logger.warning(f"Invalid dataset urn {dataset_urn}. Could not get key!")
-            return None
-
-        view_lineage_map = inspector._populate_view_lineage(schema)
-        if dataset_key.name is not None:
-            dataset_name = dataset_key.name
+        lineage = self._get_view_lineage_map(inspector, schema).get(dataset_name)
 
-        else:
-            # Handle the case when dataset_key.name is None
-            # You can raise an exception, log a warning, or take any other appropriate action
-            logger.warning("Invalid dataset name")
-
-        lineage = view_lineage_map[dataset_name]
-
-        if lineage is None:
-            logger.debug(f"No lineage found for {dataset_name}")
+        if not lineage:
+            logger.debug("No lineage found for %s", dataset_name)
             return None
         upstream_tables: List[UpstreamClass] = []
 
-        for lineage_entry in lineage:
-            # Update the view-lineage
-            upstream_table_name = lineage_entry[0]
-
+        for upstream_table_name in dict.fromkeys(lineage):
             upstream_table = UpstreamClass(
-                dataset=make_dataset_urn_with_platform_instance(
-                    self.platform,
-                    upstream_table_name,
-                    self.config.platform_instance,
-                    self.config.env,
-                ),
+                dataset=self._make_dataset_urn(upstream_table_name),
                 type=DatasetLineageTypeClass.TRANSFORMED,
             )
             upstream_tables.append(upstream_table)
 
         if upstream_tables:
-            logger.debug(
-                f" lineage of '{dataset_name}': {[u.dataset for u in upstream_tables]}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f" lineage of '{dataset_name}': {[u.dataset for u in upstream_tables]}"
+                )
 
             return UpstreamLineage(upstreams=upstream_tables)
 
@@ -651,9 +748,12 @@ class VerticaSource(SQLAlchemySource):
         schema: str,
         sql_config: SQLAlchemyConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
-        projection_seen: Set[str] = set()
+        if _is_schema_denied(sql_config.table_pattern, schema):
+            self.report.report_dropped(f"{schema}.*")
+            return
+
         try:
-            projections = inspector.get_projection_names(schema)
+            projections = self._get_projection_names(inspector, schema)
 
             # created new function get_all_projection_columns in vertica Dialect as the existing get_columns of SQLAlchemy VerticaInspector class is being used for profiling
             # And query in get_all_projection_columns is modified to run at schema level.
@@ -661,190 +761,110 @@ class VerticaSource(SQLAlchemySource):
 
             # called get_projection_properties function from dialect , it returns a list description and properties of all view in the schema
             description, properties, location_urn = self.get_projection_properties(
-                inspector, schema, projections
+                inspector, schema, None
             )
 
             # called get_view_owner function from dialect , it returns a list of all owner of all view in the schema
             projection_owner = inspector.get_projection_owner(schema)
 
-            # started a loop on each view in the schema
-            for projection_name in projections:
-                finalcolumns = []
-                # loops through all the columns in the schema and find all the columns of current projection
-                for column in columns:
-                    if column["tablename"] == projection_name.lower():
-                        finalcolumns.append(column)
-
-                projection_properties = {}
-                # loops through all the properties in current schema and find all the properties of current projection
-                for projection_comment in properties:
-
-                    if (
-                        isinstance(projection_comment, dict)
-                        and projection_comment.get("projection_name")
-                        == projection_name.lower()
-                    ):
-
-                        projection_properties["Ros count"] = str(
-                            projection_comment.get("ROS_Count", "Not Available")
-                        )
-                        projection_properties["Projection Type"] = str(
-                            projection_comment.get("Projection_Type", "Not Available")
-                        )
-                        projection_properties["is_segmented"] = str(
-                            projection_comment.get("is_segmented", "Not Available")
-                        )
-                        projection_properties["Segmentation_key"] = str(
-                            projection_comment.get("Segmentation_key", "Not Available")
-                        )
-                        projection_properties["Partition_Key"] = str(
-                            projection_comment.get("Partition_Key", "Not Available")
-                        )
-                        projection_properties["Partition Size"] = str(
-                            projection_comment.get("Partition_Size", "0")
-                        )
-                        projection_properties["Projection Size"] = str(
-                            projection_comment.get("projection_size", "0 KB")
-                        )
-                        projection_properties["Projection Cached"] = str(
-                            projection_comment.get("Projection_Cached", "False")
-                        )
-
-                owner_name = None
-                # loops through all owners in the schema and saved the value of current projection owner
-                for owner in projection_owner:
-                    if owner[0].lower() == projection_name.lower():
-                        owner_name = owner[1]
+            columns_by_projection = _group_columns_by_table(columns)
+            owner_by_projection = _get_owner_by_table(projection_owner)
+            comment_by_projection: Dict[str, dict] = {}
+            for comment in properties:
+                if isinstance(comment, dict):
+                    name = comment.get("projection_name")
+                    if name is not None:
+                        comment_by_projection[name] = comment
 
+            # started a loop on each view in the schema
+            for projection_name in dict.fromkeys(projections):
                 dataset_name = self.get_identifier(
                     schema=schema, entity=projection_name, inspector=inspector
                 )
 
-                if dataset_name not in projection_seen:
-                    projection_seen.add(dataset_name)
-                else:
-                    logger.debug(f"{dataset_name} has already been seen, skipping...")
-                    continue
-
                 self.report.report_entity_scanned(dataset_name, ent_type="projection")
                 if not sql_config.table_pattern.allowed(dataset_name):
                     self.report.report_dropped(dataset_name)
                     continue
-                dataset_urn = make_dataset_urn_with_platform_instance(
-                    self.platform,
-                    dataset_name,
-                    self.config.platform_instance,
-                    self.config.env,
+
+                lower_projection_name = projection_name.lower()
+                finalcolumns = columns_by_projection.get(lower_projection_name, [])
+
+                projection_properties = {}
+                projection_comment: Optional[dict] = comment_by_projection.get(
+                    lower_projection_name
                 )
+                if projection_comment is not None:
+                    projection_properties["Ros count"] = str(
+                        projection_comment.get("ROS_Count", "Not Available")
+                    )
+                    projection_properties["Projection Type"] = str(
+                        projection_comment.get("Projection_Type", "Not Available")
+                    )
+                    projection_properties["is_segmented"] = str(
+                        projection_comment.get("is_segmented", "Not Available")
+                    )
+                    projection_properties["Segmentation_key"] = str(
+                        projection_comment.get("Segmentation_key", "Not Available")
+                    )
+                    projection_properties["Partition_Key"] = str(
+                        projection_comment.get("Partition_Key", "Not Available")
+                    )
+                    projection_properties["Partition Size"] = str(
+                        projection_comment.get("Partition_Size", "0")
+                    )
+                    projection_properties["Projection Size"] = str(
+                        projection_comment.get("projection_size", "0 KB")
+                    )
+                    projection_properties["Projection Cached"] = str(
+                        projection_comment.get("Projection_Cached", "False")
+                    )
+
+                owner_name = owner_by_projection.get(lower_projection_name)
+
+                dataset_urn = self._make_dataset_urn(dataset_name)
 
                 yield from add_owner_to_entity_wu(
                     entity_type="dataset",
                     entity_urn=dataset_urn,
                     owner_urn=f"urn:li:corpuser:{owner_name}",
                 )
-                dataset_snapshot = DatasetSnapshot(
-                    urn=dataset_urn,
-                    aspects=[StatusClass(removed=False)],
-                )
-
-                dataset_properties = DatasetPropertiesClass(
-                    name=projection_name,
+                yield from self._process_entity(
+                    dataset_name=dataset_name,
+                    dataset_urn=dataset_urn,
+                    inspector=inspector,
+                    schema=schema,
+                    entity=projection_name,
                     description=description,
-                    customProperties=projection_properties,
+                    properties=projection_properties,
+                    columns=finalcolumns,
+                    subtype="Projections",
+                    sql_config=sql_config,
                 )
 
-                dataset_snapshot.aspects.append(dataset_properties)
-
-                pk_constraints: dict = {}
-                extra_tags: Optional[Dict[str, List[str]]] = None
-                foreign_keys: Optional[List[ForeignKeyConstraintClass]] = None
-
-                schema_fields = self.get_schema_fields(
-                    dataset_name, finalcolumns, pk_constraints, tags=extra_tags
-                )
-
-                schema_metadata = get_schema_metadata(
-                    self.report,
-                    dataset_name,
-                    self.platform,
-                    finalcolumns,
-                    pk_constraints,
-                    foreign_keys,
-                    schema_fields,
-                )
-                dataset_snapshot.aspects.append(schema_metadata)
-                db_name = self.get_db_name(inspector)
-                yield from self.add_table_to_schema_container(
-                    dataset_urn, db_name, schema
-                )
-                mce = MetadataChangeEvent(proposedSnapshot=dataset_snapshot)
-                yield SqlWorkUnit(id=dataset_name, mce=mce)
-                dpi_aspect = self.get_dataplatform_instance_aspect(
-                    dataset_urn=dataset_urn
-                )
-                if dpi_aspect:
-                    yield dpi_aspect
-                yield MetadataChangeProposalWrapper(
-                    entityType="dataset",
-                    changeType=ChangeTypeClass.UPSERT,
-                    entityUrn=dataset_urn,
-                    aspectName="subTypes",
-                    aspect=SubTypesClass(typeNames=["Projections"]),
-                ).as_workunit()
-
-                if self.config.domain:
-                    assert self.domain_registry
-                    yield from get_domain_wu(
-                        dataset_name=dataset_name,
-                        entity_urn=dataset_urn,
-                        domain_config=self.config.domain,
-                        domain_registry=self.domain_registry,
-                    )
-
                 if self.config.include_projection_lineage:
                     try:
-                        dataset_urn = make_dataset_urn_with_platform_instance(
-                            self.platform,
-                            dataset_name,
-                            self.config.platform_instance,
-                            self.config.env,
-                        )
-
-                        dataset_snapshot = DatasetSnapshot(
-                            urn=dataset_urn, aspects=[StatusClass(removed=False)]
-                        )
-
                         lineage_info = self._get_upstream_lineage_info_projection(
-                            dataset_urn, schema, inspector
+                            dataset_name, schema, inspector
                         )
 
                         if lineage_info is not None:
-                            upstream_lineage = lineage_info
-
-                            lineage_mcpw = MetadataChangeProposalWrapper(
-                                entityType="dataset",
-                                changeType=ChangeTypeClass.UPSERT,
-                                entityUrn=dataset_snapshot.urn,
-                                aspectName="upstreamLineage",
-                                aspect=upstream_lineage,
-                            )
-
-                            lineage_wu = MetadataWorkUnit(
-                                id=f"{self.platform}-{lineage_mcpw.entityUrn}-{lineage_mcpw.aspectName}",
-                                mcp=lineage_mcpw,
-                            )
-
-                            self.report.report_workunit(lineage_wu)
-                            yield lineage_wu
+                            yield MetadataChangeProposalWrapper(
+                                entityUrn=dataset_urn, aspect=lineage_info
+                            ).as_workunit()
 
                     except Exception as e:
                         logger.warning(
-                            f"Unable to get lineage of projection {projection_name} due to an exception.\n {traceback.format_exc()}"
+                            "Unable to get lineage of projection %s due to an exception.",
+                            projection_name,
+                            exc_info=True,
                         )
                         self.report.report_warning(f"{schema}", f"Ingestion error: {e}")
 
         except Exception as e:
-            print(traceback.format_exc())
+            logger.debug(
+                "Unable to ingest projections of schema %s", schema, exc_info=True
+            )
             self.report.report_failure(f"{schema}", f"Projections error: {e}")
 
     def get_projection_properties(
@@ -864,10 +884,7 @@ class VerticaSource(SQLAlchemySource):
         except NotImplementedError:
             return description, properties, location
 
-        description = table_info.get("text")
-        if type(description) is tuple:
-            # Handling for value type tuple which is coming for dialect 'db2+ibm_db'
-            description = table_info["text"][0]
+        description = self._extract_description(table_info)
 
         # The "properties" field is a non-standard addition to SQLAlchemy's interface.
         properties = table_info.get("properties", {})
@@ -875,41 +892,27 @@ class VerticaSource(SQLAlchemySource):
         return description, properties, location
 
     def _get_upstream_lineage_info_projection(
-        self, dataset_urn: str, schema: str, inspector: VerticaInspector
+        self, dataset_name: str, schema: str, inspector: VerticaInspector
     ) -> Optional[_Aspect]:
-        dataset_key = dataset_urn_to_key(dataset_urn)
-        if dataset_key is None:
-            logger.warning(f"Invalid dataset urn {dataset_urn}. Could not get key!")
-            return None
-
-        projection_lineage = inspector._populate_projection_lineage(schema)
-        dataset_name = dataset_key.name
-        lineage = projection_lineage[dataset_name]
+        lineage = self._get_projection_lineage_map(inspector, schema).get(dataset_name)
 
-        if not (lineage):
-            logger.debug(f"No lineage found for {dataset_name}")
+        if not lineage:
+            logger.debug("No lineage found for %s", dataset_name)
             return None
         upstream_tables: List[UpstreamClass] = []
 
-        for lineage_entry in lineage:
-            # Update the view-lineage
-            upstream_table_name = lineage_entry[0]
-
+        for upstream_table_name in dict.fromkeys(lineage):
             upstream_table = UpstreamClass(
-                dataset=make_dataset_urn_with_platform_instance(
-                    self.platform,
-                    upstream_table_name,
-                    self.config.platform_instance,
-                    self.config.env,
-                ),
+                dataset=self._make_dataset_urn(upstream_table_name),
                 type=DatasetLineageTypeClass.TRANSFORMED,
             )
             upstream_tables.append(upstream_table)
 
         if upstream_tables:
-            logger.debug(
-                f" lineage of '{dataset_name}': {[u.dataset for u in upstream_tables]}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f" lineage of '{dataset_name}': {[u.dataset for u in upstream_tables]}"
+                )
 
             return UpstreamLineage(upstreams=upstream_tables)
 
@@ -929,10 +932,9 @@ class VerticaSource(SQLAlchemySource):
         """
         from datahub.ingestion.source.ge_data_profiler import GEProfilerRequest
 
-        tables_seen: Set[str] = set()
         profile_candidates = None  # Default value if profile candidates not available.
         yield from super().loop_profiler_requests(inspector, schema, sql_config)
-        for projection in inspector.get_projection_names(schema):
+        for projection in dict.fromkeys(self._get_projection_names(inspector, schema)):
             dataset_name = self.get_identifier(
                 schema=schema, entity=projection, inspector=inspector
             )
@@ -943,11 +945,6 @@ class VerticaSource(SQLAlchemySource):
                 if self.config.profiling.report_dropped_profiles:
                     self.report.report_dropped(f"profile of {dataset_name}")
                 continue
-            if dataset_name not in tables_seen:
-                tables_seen.add(dataset_name)
-            else:
-                logger.debug(f"{dataset_name} has already been seen, skipping...")
-                continue
             missing_column_info_warn = self.report.warnings.get(MISSING_COLUMN_INFO)
             if (
                 missing_column_info_warn is not None
@@ -1009,90 +1006,39 @@ class VerticaSource(SQLAlchemySource):
         Yields:
             Iterator[Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]]:
         """
-        models_seen: Set[str] = set()
         try:
-            for models in inspector.get_models_names(schema):
+            for models in dict.fromkeys(inspector.get_models_names(schema)):
                 dataset_name = self.get_identifier(
                     schema="Entities", entity=models, inspector=inspector
                 )
 
-                if dataset_name not in models_seen:
-                    models_seen.add(dataset_name)
-                else:
-                    logger.debug("has already been seen, skipping... %s", dataset_name)
-                    continue
                 self.report.report_entity_scanned(dataset_name, ent_type="models")
                 if not sql_config.table_pattern.allowed(dataset_name):
                     self.report.report_dropped(dataset_name)
                     continue
                 try:
-                    columns: List[Dict[Any, Any]] = []
-                    dataset_urn = make_dataset_urn_with_platform_instance(
-                        self.platform,
-                        dataset_name,
-                        self.config.platform_instance,
-                        self.config.env,
-                    )
-                    dataset_snapshot = DatasetSnapshot(
-                        urn=dataset_urn,
-                        aspects=[StatusClass(removed=False)],
-                    )
+                    dataset_urn = self._make_dataset_urn(dataset_name)
                     description, properties, location = self.get_model_properties(
                         inspector, schema, models
                     )
-
-                    dataset_properties = DatasetPropertiesClass(
-                        name=models,
+                    yield from self._process_entity(
+                        dataset_name=dataset_name,
+                        dataset_urn=dataset_urn,
+                        inspector=inspector,
+                        schema=schema,
+                        entity=models,
                         description=description,
-                        customProperties=properties,
-                    )
-
-                    dataset_snapshot.aspects.append(dataset_properties)
-                    pk_constraints: dict = {}
-                    foreign_keys: Optional[List[ForeignKeyConstraintClass]] = None
-                    schema_fields = self.get_schema_fields(dataset_name, columns)
-
-                    schema_metadata = get_schema_metadata(
-                        self.report,
-                        dataset_name,
-                        self.platform,
-                        columns,
-                        pk_constraints,
-                        foreign_keys,
-                        schema_fields,
+                        properties=properties,
+                        columns=[],
+                        subtype="ML Models",
+                        sql_config=sql_config,
                     )
-
-                    dataset_snapshot.aspects.append(schema_metadata)
-                    db_name = self.get_db_name(inspector)
-
-                    yield from self.add_table_to_schema_container(
-                        dataset_urn, db_name, schema
-                    )
-                    mce = MetadataChangeEvent(proposedSnapshot=dataset_snapshot)
-                    yield SqlWorkUnit(id=dataset_name, mce=mce)
-                    dpi_aspect = self.get_dataplatform_instance_aspect(
-                        dataset_urn=dataset_urn
-                    )
-                    if dpi_aspect:
-                        yield dpi_aspect
-                    yield MetadataChangeProposalWrapper(
-                        entityType="dataset",
-                        changeType=ChangeTypeClass.UPSERT,
-                        entityUrn=dataset_urn,
-                        aspectName="subTypes",
-                        aspect=SubTypesClass(typeNames=["ML Models"]),
-                    ).as_workunit()
-                    if self.config.domain:
-                        assert self.domain_registry
-                        yield from get_domain_wu(
-                            dataset_name=dataset_name,
-                            entity_urn=dataset_urn,
-                            domain_config=self.config.domain,
-                            domain_registry=self.domain_registry,
-                        )
                 except Exception as error:
                     logger.warning(
-                        f"Unable to ingest {schema}.{models} due to an exception. %s {traceback.format_exc()}"
+                        "Unable to ingest %s.%s due to an exception.",
+                        schema,
+                        models,
+                        exc_info=True,
                     )
                     self.report.report_warning(
                         f"{schema}.{models}", f"Ingestion error: {error}"
@@ -1126,5 +1072,7 @@ class VerticaSource(SQLAlchemySource):
         description = table_info.get("text")
 
         # The "properties" field is a non-standard addition to SQLAlchemy's interface.
-        properties = table_info.get("properties", {})
+        # get_model_comment is reflection-cached, so hand out a copy rather than the
+        # cached dict itself.
+        properties = dict(table_info.get("properties", {}))
         return description, properties, location
@@ -3,6 +3,7 @@ from unittest.mock import Mock
 
 import pytest
 from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.exc import ProgrammingError
 
 from datahub.ingestion.source.sql.sql_common import (
     PipelineContext,
@@ -103,3 +104,28 @@ PLATFORM_FROM_SQLALCHEMY_URI_TEST_CASES: Dict[str, str] = {
 def test_get_platform_from_sqlalchemy_uri(uri: str, expected_platform: str) -> None:
     platform: str = get_platform_from_sqlalchemy_uri(uri)
     assert platform == expected_platform
+
+
+def test_get_table_properties_quoted_schema_is_remembered_per_schema():
+    config: SQLAlchemyConfig = _TestSQLAlchemyConfig()
+    ctx: PipelineContext = PipelineContext(run_id="test_ctx")
+    source = _TestSQLAlchemySource(config=config, ctx=ctx, platform="TEST")
+
+    def get_table_comment(table, schema):
+        # "quoted" only accepts a quoted schema name, "public" only a plain one
+        if schema == "quoted" or schema == '"public"':
+            raise ProgrammingError("statement", {}, Exception("bad schema"))
+        return {"text": f"{table} in {schema}"}
+
+    inspector: Inspector = Mock()
+    inspector.get_table_comment = Mock(side_effect=get_table_comment)
+
+    assert source.get_table_properties(inspector, "quoted", "t1")[0] == (
+        't1 in "quoted"'
+    )
+    assert source.get_table_properties(inspector, "public", "t2")[0] == ("t2 in public")
+    inspector.get_table_comment.reset_mock()
+    assert source.get_table_properties(inspector, "quoted", "t3")[0] == (
+        't3 in "quoted"'
+    )
+    inspector.get_table_comment.assert_called_once_with("t3", '"quoted"')